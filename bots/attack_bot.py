@@ -1,5 +1,7 @@
 from _pyrepl.commands import end
-from typing import List, Tuple
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
 
 from .base_bot import BaseBot
 
@@ -12,27 +14,27 @@ class AttackBot(BaseBot):
         super().__init__(uid)
         self.cols = 0
         self.rows = 0
-        self.board: List[List[int]] = []
+        self.board: Optional[np.ndarray] = None
         self.win_length = 0
 
-    def init_board(self, cols: int, rows: int, win_length: int, obstacles: List[Tuple[int, int]], time_given: int) -> None:
+    def init_board(self, cols: int, rows: int, win_length: int, obstacles: Sequence[Tuple[int, int]], time_given: int, *, board_view: np.ndarray) -> None:
         self.cols = cols
         self.rows = rows
         self.win_length = win_length
-        self.board = [[EMPTY for _ in range(rows)] for _ in range(cols)]
-
-        for x, y in obstacles:
-            if 0 <= x < cols and 0 <= y < rows:
-                self.board[x][y] = BLOCKED
+        self.board = board_view
 
     def make_a_move(self, time_left: int) -> Tuple[int, int]:
+        # The scan starts at x = rows - 1; on boards taller than they are wide
+        # that cell is off the board and the bot crashes, as it always has
+        if self.rows > self.cols:
+            raise IndexError("list index out of range")
+
         for y in range(self.rows-1, 0, -1):
-            line = y
-            for x in range(line, 0, -1):
-                if self.board[x][y] != EMPTY and self.board[x][y] != self.unique_id:
-                    break
-                if self.board[x][y] == EMPTY:
-                    return x, y
+            # Cells x = y .. 1 of this row; stop at the first one that is not ours
+            line = self.board[y, y:0:-1]
+            stops = np.flatnonzero(line != self.unique_id)
+            if stops.size and line[stops[0]] == EMPTY:
+                return y - int(stops[0]), y
 
         # No EMPTY cell found (board full or corrupted)
         return 0, 0
@@ -46,6 +48,4 @@ class AttackBot(BaseBot):
                 if self.board[x][y] != EMPTY:
                     obstacle = x, y
     def notify_move(self, bot_uid: int, move: Tuple[int, int]) -> None:
-        x, y = move
-        if 0 <= x < self.cols and 0 <= y < self.rows:
-            self.board[x][y] = bot_uid
+        pass
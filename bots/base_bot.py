@@ -1,4 +1,25 @@
-from typing import List, Tuple
+import os
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+# Most random values a bot should draw per refill; short games rarely use more
+RNG_BATCH = 32
+
+# One generator per process for bots to share: creating one per bot costs
+# more than a short game's worth of draws
+shared_rng = np.random.default_rng()
+
+
+def _reseed_shared_rng() -> None:
+    # Reseed in place so modules that imported shared_rng keep a live reference
+    shared_rng.bit_generator.state = type(shared_rng.bit_generator)().state
+
+
+# Forked workers would otherwise all replay the parent's stream
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_shared_rng)
+
 
 class BaseBot:
     """
@@ -7,6 +28,21 @@ class BaseBot:
         - init_board()
         - make_a_move()
         - notify_move()
+
+    obstacles is a sorted tuple without duplicates. Cell (x, y) of a
+    cols x rows board maps to bit x * rows + y of the bitboards passed to
+    init_board() (e.g. blocked_mask).
+
+    The keywords after time_given are only passed to bots whose
+    init_board() declares them (or takes **kwargs); bots written against
+    the five-argument signature keep working unchanged.
+
+    board_view is the arbiter's live board as a read-only int8 array of
+    shape (rows, cols), indexed board_view[y, x]; it already reflects every
+    move by the time notify_move() is called. It cannot be made writeable;
+    bots that want to mark cells themselves must work on board_view.copy().
+    The arbiter always passes it to bots that declare it, so bots relying
+    on it should declare it without a default.
     """
 
     def __init__(self, uid: int):
@@ -14,7 +50,7 @@ class BaseBot:
         # Always use the actual class name as the bot name
         self.name = self.__class__.__name__
 
-    def init_board(self, cols: int, rows: int, win_length: int, obstacles: List[Tuple[int, int]], time_given: int) -> None:
+    def init_board(self, cols: int, rows: int, win_length: int, obstacles: Sequence[Tuple[int, int]], time_given: int, blocked_mask: int = 0, board_view: Optional[np.ndarray] = None) -> None:
         raise NotImplementedError
 
     def make_a_move(self, time_left: int) -> Tuple[int, int]:
@@ -1,9 +1,10 @@
-from typing import List, Tuple
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
 
 from .base_bot import BaseBot
 
 EMPTY = -1
-BLOCKED = -2
 
 
 class DiagonalBot(BaseBot):
@@ -11,31 +12,24 @@ class DiagonalBot(BaseBot):
         super().__init__(uid)
         self.cols = 0
         self.rows = 0
-        self.board: List[List[int]] = []
+        self.board: Optional[np.ndarray] = None
 
-    def init_board(self, cols: int, rows: int, win_length: int, obstacles: List[Tuple[int, int]], time_given: int) -> None:
+    def init_board(self, cols: int, rows: int, win_length: int, obstacles: Sequence[Tuple[int, int]], time_given: int, *, board_view: np.ndarray) -> None:
         self.cols = cols
         self.rows = rows
 
-        self.board = [[EMPTY for _ in range(rows)] for _ in range(cols)]
-
-        for x, y in obstacles:
-            if 0 <= x < cols and 0 <= y < rows:
-                self.board[x][y] = BLOCKED
+        self.board = board_view
 
     def make_a_move(self, time_left: int) -> Tuple[int, int]:
-        max_diag = self.cols + self.rows - 2
-        for s in range(max_diag + 1):
-            for x in range(self.cols):
-                y = s + x
-                if 0 <= y < self.rows:
-                    if self.board[x][y] == EMPTY:
-                        return x, y
+        # Diagonal s holds the cells (x, s + x)
+        for s in range(self.rows):
+            empties = np.flatnonzero(self.board.diagonal(-s) == EMPTY)
+            if empties.size:
+                x = int(empties[0])
+                return x, s + x
 
         # No EMPTY cell found (board full or corrupted)
         return 0, 0
 
     def notify_move(self, bot_uid: int, move: Tuple[int, int]) -> None:
-        x, y = move
-        if 0 <= x < self.cols and 0 <= y < self.rows:
-            self.board[x][y] = bot_uid
+        pass
@@ -1,24 +1,32 @@
-import random
-import time
 from typing import List, Tuple
 
-from .base_bot import BaseBot
+from .base_bot import RNG_BATCH, BaseBot, shared_rng
 
 
 class RandomBot(BaseBot):
     def __init__(self, uid: int):
         super().__init__(uid)
-        self.rng = random.Random(time.time_ns())
         self.cols = 0
         self.rows = 0
+        self.batch = RNG_BATCH
+        self.moves: List[int] = []
+        self.next_move = 0
 
     def init_board(self, cols, rows, win_length, obstacles, time_given):
         self.cols = cols
         self.rows = rows
+        self.batch = min(RNG_BATCH, cols * rows)
+        self.moves = []
+        self.next_move = 0
 
     def make_a_move(self, time_left) -> Tuple[int, int]:
-        return (self.rng.randrange(self.cols),
-                self.rng.randrange(self.rows))
+        if self.next_move == len(self.moves):
+            # Flat indices x * rows + y
+            self.moves = shared_rng.integers(0, self.cols * self.rows, size=self.batch).tolist()
+            self.next_move = 0
+        idx = self.moves[self.next_move]
+        self.next_move += 1
+        return divmod(idx, self.rows)
 
     def notify_move(self, bot_uid: int, move: Tuple[int, int]):
         pass
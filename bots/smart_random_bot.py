@@ -1,49 +1,50 @@
-import random
-import time
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
-from .base_bot import BaseBot
+import numpy as np
 
+from .base_bot import RNG_BATCH, BaseBot, shared_rng
 
 EMPTY = -1
-BLOCKED = -2
 
 
 class SmartRandomBot(BaseBot):
     def __init__(self, uid: int):
         super().__init__(uid)
-        self.rng = random.Random(time.time_ns())
+        self.batch = RNG_BATCH
+        self.draws: List[float] = []
+        self.next_draw = 0
         self.cols = 0
         self.rows = 0
-        self.board: List[List[int]] = []
-        self.empty_cells: List[Tuple[int, int]] = []
+        # Empty cells as flat indices x * rows + y
+        self.empty_cells: List[int] = []
+        self.cell_index: Dict[int, int] = {}
 
-    def init_board(self, cols: int, rows: int, win_length: int, obstacles: List[Tuple[int, int]], time_given: int) -> None:
+    def init_board(self, cols: int, rows: int, win_length: int, obstacles: Sequence[Tuple[int, int]], time_given: int, *, board_view: np.ndarray) -> None:
         self.cols = cols
         self.rows = rows
+        self.draws = []
+        self.next_draw = 0
 
-        self.board = [[EMPTY for _ in range(rows)] for _ in range(cols)]
-
-        obs_set = set(obstacles)
-        for x, y in obs_set:
-            if 0 <= x < cols and 0 <= y < rows:
-                self.board[x][y] = BLOCKED
-
-        self.empty_cells = [
-            (x, y)
-            for x in range(cols)
-            for y in range(rows)
-            if self.board[x][y] == EMPTY
-        ]
+        # Transposed so the flat order is x * rows + y
+        self.empty_cells = np.flatnonzero(board_view.T == EMPTY).tolist()
+        self.cell_index = {cell: i for i, cell in enumerate(self.empty_cells)}
+        # Each bot takes at most every other empty cell
+        self.batch = max(1, min(RNG_BATCH, (len(self.empty_cells) + 1) // 2))
 
     def make_a_move(self, time_left: int) -> Tuple[int, int]:
         # If no empty cells remain, fall back to something (should not happen)
         if not self.empty_cells:
-            x = self.rng.randrange(self.cols)
-            y = self.rng.randrange(self.rows)
+            x = int(shared_rng.integers(self.cols))
+            y = int(shared_rng.integers(self.rows))
             return x, y
 
-        x, y = self.rng.choice(self.empty_cells)
+        if self.next_draw == len(self.draws):
+            self.draws = shared_rng.random(self.batch).tolist()
+            self.next_draw = 0
+        u = self.draws[self.next_draw]
+        self.next_draw += 1
+
+        x, y = divmod(self.empty_cells[int(u * len(self.empty_cells))], self.rows)
         return x, y
 
     def notify_move(self, bot_uid: int, move: Tuple[int, int]) -> None:
@@ -51,9 +52,11 @@ class SmartRandomBot(BaseBot):
         if not (0 <= x < self.cols and 0 <= y < self.rows):
             return
 
-        self.board[x][y] = bot_uid
-
-        try:
-            self.empty_cells.remove((x, y))
-        except ValueError:
-            pass
+        # Swap the taken cell with the last one and pop: O(1) instead of list.remove
+        i = self.cell_index.pop(x * self.rows + y, None)
+        if i is None:
+            return
+        last = self.empty_cells.pop()
+        if i < len(self.empty_cells):
+            self.empty_cells[i] = last
+            self.cell_index[last] = i
@@ -1,9 +1,10 @@
-from typing import List, Tuple
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
 
 from .base_bot import BaseBot
 
 EMPTY = -1
-BLOCKED = -2
 
 
 class WalkingBot(BaseBot):
@@ -11,27 +12,26 @@ class WalkingBot(BaseBot):
         super().__init__(uid)
         self.cols = 0
         self.rows = 0
-        self.board: List[List[int]] = []
+        self.cells: Optional[np.ndarray] = None
+        self.next_idx = 0
 
-    def init_board(self, cols: int, rows: int, win_length: int, obstacles: List[Tuple[int, int]], time_given: int) -> None:
+    def init_board(self, cols: int, rows: int, win_length: int, obstacles: Sequence[Tuple[int, int]], time_given: int, *, board_view: np.ndarray) -> None:
         self.cols = cols
         self.rows = rows
-        self.board = [[EMPTY for _ in range(rows)] for _ in range(cols)]
-
-        for x, y in obstacles:
-            if 0 <= x < cols and 0 <= y < rows:
-                self.board[x][y] = BLOCKED
+        # Row-major flat view: walking order is y, then x
+        self.cells = board_view.ravel()
+        self.next_idx = 0
 
     def make_a_move(self, time_left: int) -> Tuple[int, int]:
-        for y in range(self.rows):
-            for x in range(self.cols):
-                if self.board[x][y] == EMPTY:
-                    return x, y
+        # Cells only ever fill up, so the first EMPTY never moves backwards
+        empties = np.flatnonzero(self.cells[self.next_idx:] == EMPTY)
+        if empties.size:
+            self.next_idx += int(empties[0])
+            y, x = divmod(self.next_idx, self.cols)
+            return x, y
 
         # No EMPTY cell found (board full or corrupted)
         return 0, 0
 
     def notify_move(self, bot_uid: int, move: Tuple[int, int]) -> None:
-        x, y = move
-        if 0 <= x < self.cols and 0 <= y < self.rows:
-            self.board[x][y] = bot_uid
+        pass
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import inspect
 import logging
+import operator
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import List, Tuple, Optional
+from functools import lru_cache
+from typing import List, Sequence, Tuple, Optional
+
+import numpy as np
 
 logger = logging.getLogger("game")
 
@@ -15,6 +20,23 @@ class BoardCell(IntEnum):
     # players are 0..N-1
 
 
+class MoveStatus(IntEnum):
+    OK = 0
+    WIN = 1
+    DRAW = 2
+    OUTSIDE = 3
+    BLOCKED = 4
+    OCCUPIED = 5
+
+
+# status -> (log message, elimination reason)
+_ILLEGAL_MOVES = {
+    MoveStatus.OUTSIDE: ("outside of board", "outside board"),
+    MoveStatus.BLOCKED: ("blocked cell", "blocked cell"),
+    MoveStatus.OCCUPIED: ("occupied cell", "occupied cell"),
+}
+
+
 @dataclass
 class BoardConfig:
     name: str
@@ -22,8 +44,27 @@ class BoardConfig:
     height: int
     win_length: int
     num_players: int
-    obstacles: List[Tuple[int, int]]
+    obstacles: Sequence[Tuple[int, int]]  # stored deduplicated, as a sorted tuple
     time_ms: int
+    # Derived from obstacles once per board and shared by every game on it:
+    # bitboard (bit x*height + y) and flat row-major indices (y*width + x).
+    blocked_mask: int = field(init=False, repr=False, compare=False)
+    obstacle_idx: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.obstacles = tuple(sorted(set(map(tuple, self.obstacles))))
+
+        blocked_mask = 0
+        for (x, y) in self.obstacles:
+            if not (0 <= x < self.width and 0 <= y < self.height):
+                raise ValueError(f"Cell ({x}, {y}) is outside of the board")
+            blocked_mask |= 1 << (x * self.height + y)
+        self.blocked_mask = blocked_mask
+        self.obstacle_idx = np.fromiter(
+            (y * self.width + x for (x, y) in self.obstacles),
+            dtype=np.intp,
+            count=len(self.obstacles),
+        )
 
 
 @dataclass
@@ -34,8 +75,65 @@ class GameResult:
     eliminated: List[int]                # indices of eliminated players
 
 
+def make_board_template(config: BoardConfig) -> np.ndarray:
+    """Empty (height, width) board with the obstacles set; copy it for each game."""
+    board = np.full((config.height, config.width), BoardCell.EMPTY, dtype=np.int8)
+    board.flat[config.obstacle_idx] = BoardCell.BLOCKED
+    return board
+
+
+@lru_cache(maxsize=None)
+def _line_masks(W: int, H: int, L: int) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+    """
+    For each direction, the cells a win_length line may start on without
+    leaving the board, and the shifts that AND a bitboard down to
+    "win_length cells in a row start here" (doubling, then one overlap).
+    """
+    masks = []
+    for dx, dy in [(1, 0), (0, 1), (1, 1), (1, -1)]:
+        start_mask = 0
+        for x in range(W):
+            for y in range(H):
+                if 0 <= x + (L - 1) * dx < W and 0 <= y + (L - 1) * dy < H:
+                    start_mask |= 1 << (x * H + y)
+        if not start_mask:
+            continue
+
+        step = dx * H + dy
+        shifts = []
+        n = 1
+        while 2 * n <= L:
+            shifts.append(n * step)
+            n *= 2
+        if n < L:
+            shifts.append((L - n) * step)
+        masks.append((start_mask, tuple(shifts)))
+    return tuple(masks)
+
+
+# Keywords init_board() receives beyond the original five arguments
+_INIT_BOARD_EXTRAS = ("blocked_mask", "board_view")
+
+
+@lru_cache(maxsize=None)
+def _init_board_extras(bot_cls: type) -> frozenset:
+    """
+    Optional init_board() keywords this bot class declares. Bots written
+    against the original five-argument signature get none of them.
+    """
+    params = inspect.signature(bot_cls.init_board).parameters.values()
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params):
+        return frozenset(_INIT_BOARD_EXTRAS)
+    return frozenset(p.name for p in params if p.name in _INIT_BOARD_EXTRAS)
+
+
 class Arbiter:
-    def __init__(self, config: BoardConfig, bot_classes: List[type]) -> None:
+    def __init__(
+        self,
+        config: BoardConfig,
+        bot_classes: List[type],
+        board_template: Optional[np.ndarray] = None,
+    ) -> None:
         self.config = config
         self.W = config.width
         self.H = config.height
@@ -46,99 +144,106 @@ class Arbiter:
                 f"but got {len(bot_classes)} bot classes."
             )
 
-        self.board: List[List[int]] = [
-            [BoardCell.EMPTY for _ in range(self.H)]
-            for _ in range(self.W)
-        ]
-
-        for (x, y) in config.obstacles:
-            self._check_inside_board(x, y)
-            self.board[x][y] = BoardCell.BLOCKED
+        # Bitboards over W*H bits, cell (x, y) is bit x*H + y.
+        self.blocked_bb = config.blocked_mask
+        self.player_bb: List[int] = [0] * config.num_players
+        # stones per player: no line is possible before win_length of them
+        self.player_counts: List[int] = [0] * config.num_players
+
+        # Row-major cell view of the same state, indexed board[y, x].
+        if board_template is None:
+            board_template = make_board_template(config)
+        # Arbiter-owned storage: bots only ever see it through a read-only view
+        self._board_buf = bytearray(board_template.tobytes())
+        self.board = np.frombuffer(self._board_buf, dtype=np.int8).reshape(self.H, self.W)
+        # _print_board lookup, indexed by cell value - BLOCKED
+        self._cell_chars = np.array(["#", "."] + [str(i) for i in range(config.num_players)])
+
+        # blocked cells plus every player's cells
+        self._any_bb = self.blocked_bb
+        # popcount of the mask, so duplicate obstacles are only counted once
+        self.empty_count = self.W * self.H - self.blocked_bb.bit_count()
+        self._line_masks = _line_masks(self.W, self.H, config.win_length)
 
         self.bots = [cls(uid=i) for i, cls in enumerate(bot_classes)]
 
         self.time_left_ms: List[int] = [config.time_ms for _ in range(config.num_players)]
 
-        self.eliminated: List[bool] = [False] * config.num_players
+        # Bit i set <=> player i is eliminated.
+        self.elim_bb = 0
+        self._all_players_bb = (1 << config.num_players) - 1
 
         self.current_player = 0
         self.winner: Optional[int] = None
 
-    def _check_inside_board(self, x: int, y: int) -> None:
-        if not (0 <= x < self.W and 0 <= y < self.H):
-            raise ValueError(f"Cell ({x}, {y}) is outside of the board")
-
-    def _is_cell_empty(self, x: int, y: int) -> bool:
-        return self.board[x][y] == BoardCell.EMPTY
+    def _active_mask(self) -> int:
+        return self._all_players_bb & ~self.elim_bb
 
-    def _board_full(self) -> bool:
-        return all(cell != BoardCell.EMPTY for row in self.board for cell in row)
-
-    def _active_players(self) -> List[int]:
-        return [i for i, eliminated in enumerate(self.eliminated) if not eliminated]
+    def _eliminated_indices(self) -> List[int]:
+        return [i for i in range(self.config.num_players) if (self.elim_bb >> i) & 1]
 
     def _next_active_player(self, current: int) -> int:
+        active = self._active_mask()
+        if not active:
+            return current  # fallback; should not be used if at least one active player exists
+        # Rotate the active mask so bit 0 is player current+1, then take the lowest set bit
         n = self.config.num_players
-        for offset in range(1, n + 1):
-            idx = (current + offset) % n
-            if not self.eliminated[idx]:
-                return idx
-        return current  # fallback; should not be used if at least one active player exists
+        k = (current + 1) % n
+        rot = ((active >> k) | (active << (n - k))) & self._all_players_bb
+        return (k + (rot & -rot).bit_length() - 1) % n
 
     def _eliminate_player(self, pid: int, reason: str) -> bool:
-        if self.eliminated[pid]:
+        if (self.elim_bb >> pid) & 1:
             return False  # already eliminated
 
         bot = self.bots[pid]
-        logger.info(f"  Bot P{pid} ({bot.name}) is ELIMINATED: {reason}")
-        self.eliminated[pid] = True
+        logger.info("  Bot P%d (%s) is ELIMINATED: %s", pid, bot.name, reason)
+        self.elim_bb |= 1 << pid
 
-        active = self._active_players()
+        active = self._active_mask()
         if not active:
             # Everyone eliminated: no winner
             self.winner = None
             return True
-        if len(active) == 1:
+        if active.bit_count() == 1:
             # Exactly one player left: that player wins
-            self.winner = active[0]
+            self.winner = active.bit_length() - 1
             return True
 
         return False
 
     def _check_winner_from_last_move(self, x: int, y: int, pid: int) -> bool:
-        def count_dir(dx: int, dy: int) -> int:
-            c = 1  # include (x, y)
-            # forward
-            cx, cy = x + dx, y + dy
-            while 0 <= cx < self.W and 0 <= cy < self.H and self.board[cx][cy] == pid:
-                c += 1
-                cx += dx
-                cy += dy
-            # backward
-            cx, cy = x - dx, y - dy
-            while 0 <= cx < self.W and 0 <= cy < self.H and self.board[cx][cy] == pid:
-                c += 1
-                cx -= dx
-                cy -= dy
-            return c
-
-        for dx, dy in [(1, 0), (0, 1), (1, 1), (1, -1)]:
-            if count_dir(dx, dy) >= self.config.win_length:
+        # Any line on the board must go through (x, y): the game would have
+        # ended on an earlier move otherwise.
+        pbb = self.player_bb[pid]
+        for start_mask, shifts in self._line_masks:
+            m = pbb
+            for s in shifts:
+                m &= m >> s
+            if m & start_mask:
                 return True
         return False
 
     def run(self, verbose: bool = True) -> GameResult:
         if verbose:
-            logger.info(f"\n=== Game on board '{self.config.name}' ===")
+            logger.info("\n=== Game on board '%s' ===", self.config.name)
             logger.info(
-                f"Board: {self.W}x{self.H}, win length: {self.config.win_length}, "
-                f"players: {self.config.num_players}"
+                "Board: %dx%d, win length: %d, players: %d",
+                self.W, self.H, self.config.win_length, self.config.num_players,
             )
             logger.info("Players (in order):")
             for i, bot in enumerate(self.bots):
-                logger.info(f"  P{i}: {bot.name}")
+                logger.info("  P%d: %s", i, bot.name)
             logger.info("")
 
+        # Bots read the live board through this; it must not be written to.
+        # Backed by a read-only memoryview, so numpy refuses to make it writeable again
+        board_view = np.frombuffer(
+            memoryview(self._board_buf).toreadonly(), dtype=np.int8,
+        ).reshape(self.H, self.W)
+
+        extras = {"blocked_mask": self.blocked_bb, "board_view": board_view}
+
         for pid, bot in enumerate(self.bots):
             try:
                 bot.init_board(
@@ -147,152 +252,162 @@ class Arbiter:
                     win_length=self.config.win_length,
                     obstacles=self.config.obstacles,
                     time_given=self.config.time_ms,
+                    **{name: extras[name] for name in _init_board_extras(type(bot))},
                 )
             except Exception as exc:
-                logger.info(f"  Bot P{pid} ({bot.name}) failed in init_board: {exc}")
+                logger.info("  Bot P%d (%s) failed in init_board: %s", pid, bot.name, exc)
                 game_over = self._eliminate_player(pid, "init_board failure")
                 if game_over:
                     if verbose:
                         logger.info("=== Game over (during initialization) ===\n")
-                    eliminated_indices = [i for i, e in enumerate(self.eliminated) if e]
                     return GameResult(
                         winner_index=self.winner,
                         board_name=self.config.name,
                         player_names=[bot.name for bot in self.bots],
-                        eliminated=eliminated_indices,
+                        eliminated=self._eliminated_indices(),
                     )
 
+        # Hot loop: bind attributes and globals to locals once
+        W, H = self.W, self.H
+        board = self.board
+        player_bb = self.player_bb
+        player_counts = self.player_counts
+        win_length = self.config.win_length
+        blocked_bb = self.blocked_bb
+        bots = self.bots
+        time_left = self.time_left_ms
+        check_winner = self._check_winner_from_last_move
+        next_active = self._next_active_player
+        illegal_moves = _ILLEGAL_MOVES
+        log_info = logger.info
+        perf_ns = time.perf_counter_ns
+
         while True:
-            if self.eliminated[self.current_player]:
-                active = self._active_players()
-                if len(active) <= 1:
+            if (self.elim_bb >> self.current_player) & 1:
+                if self._active_mask().bit_count() <= 1:
                     break
-                self.current_player = self._next_active_player(self.current_player)
+                self.current_player = next_active(self.current_player)
                 continue
 
             pid = self.current_player
-            bot = self.bots[pid]
+            bot = bots[pid]
 
             if verbose:
                 self._print_board()
-                logger.info(
-                    f"P{pid} ({bot.name}) to move. "
-                    f"Time left: {self.time_left_ms[pid]} ms"
+                log_info(
+                    "P%d (%s) to move. Time left: %d ms",
+                    pid, bot.name, time_left[pid],
                 )
 
-            start_ns = time.perf_counter_ns()
+            start_ns = perf_ns()
             try:
-                x, y = bot.make_a_move(self.time_left_ms[pid])
+                x, y = bot.make_a_move(time_left[pid])
+                # Bitboard shifts need Python ints: 1 << np.int64(k) is fixed-width
+                x, y = operator.index(x), operator.index(y)
             except Exception as exc:
-                logger.info(f"  Bot P{pid} ({bot.name}) crashed with exception: {exc}")
+                log_info("  Bot P%d (%s) crashed with exception: %s", pid, bot.name, exc)
                 game_over = self._eliminate_player(pid, "crash")
                 if game_over:
                     break
-                self.current_player = self._next_active_player(pid)
+                self.current_player = next_active(pid)
                 if verbose:
-                    logger.info("")
+                    log_info("")
                 continue
-            end_ns = time.perf_counter_ns()
+            end_ns = perf_ns()
 
             spent_ms = (end_ns - start_ns) // 1_000_000
-            self.time_left_ms[pid] -= spent_ms
-            if self.time_left_ms[pid] < 0:
-                logger.info(f"  Bot P{pid} ({bot.name}) exceeded its time budget.")
+            time_left[pid] -= spent_ms
+            if time_left[pid] < 0:
+                log_info("  Bot P%d (%s) exceeded its time budget.", pid, bot.name)
                 game_over = self._eliminate_player(pid, "timeout")
                 if game_over:
                     break
-                self.current_player = self._next_active_player(pid)
+                self.current_player = next_active(pid)
                 if verbose:
-                    logger.info("")
+                    log_info("")
                 continue
 
             if verbose:
-                logger.info(f"  Bot P{pid} -> move ({x}, {y})")
-
-            if not (0 <= x < self.W and 0 <= y < self.H):
-                logger.info("  Illegal move: outside of board.")
-                game_over = self._eliminate_player(pid, "illegal move (outside board)")
-                if game_over:
-                    break
-                self.current_player = self._next_active_player(pid)
-                if verbose:
-                    logger.info("")
-                continue
-
-            if self.board[x][y] == BoardCell.BLOCKED:
-                logger.info("  Illegal move: blocked cell.")
-                game_over = self._eliminate_player(pid, "illegal move (blocked cell)")
-                if game_over:
-                    break
-                self.current_player = self._next_active_player(pid)
-                if verbose:
-                    logger.info("")
-                continue
-
-            if not self._is_cell_empty(x, y):
-                logger.info("  Illegal move: occupied cell.")
-                game_over = self._eliminate_player(pid, "illegal move (occupied cell)")
+                log_info("  Bot P%d -> move (%s, %s)", pid, x, y)
+
+            # Validate and place the move, then classify the resulting position
+            if not (0 <= x < W and 0 <= y < H):
+                status = MoveStatus.OUTSIDE
+            else:
+                bit = 1 << (x * H + y)
+                if blocked_bb & bit:
+                    status = MoveStatus.BLOCKED
+                elif self._any_bb & bit:
+                    status = MoveStatus.OCCUPIED
+                else:
+                    player_bb[pid] |= bit
+                    self._any_bb |= bit
+                    board[y, x] = pid
+                    self.empty_count -= 1
+                    player_counts[pid] += 1
+
+                    if player_counts[pid] >= win_length and check_winner(x, y, pid):
+                        status = MoveStatus.WIN
+                    elif self.empty_count == 0:
+                        status = MoveStatus.DRAW
+                    else:
+                        status = MoveStatus.OK
+
+            if status in illegal_moves:
+                message, reason = illegal_moves[status]
+                log_info("  Illegal move: %s.", message)
+                game_over = self._eliminate_player(pid, f"illegal move ({reason})")
                 if game_over:
                     break
-                self.current_player = self._next_active_player(pid)
+                self.current_player = next_active(pid)
                 if verbose:
-                    logger.info("")
+                    log_info("")
                 continue
 
-            self.board[x][y] = pid
-
-            for other_id, other in enumerate(self.bots):
-                if self.eliminated[other_id]:
+            for other_id, other in enumerate(bots):
+                if (self.elim_bb >> other_id) & 1:
                     continue
                 try:
                     other.notify_move(pid, (x, y))
                 except Exception as exc:
-                    logger.info(f"  notify_move raised for {other.name}: {exc}")
+                    log_info("  notify_move raised for %s: %s", other.name, exc)
 
-            if self._check_winner_from_last_move(x, y, pid):
+            if status == MoveStatus.WIN:
                 self.winner = pid
                 if verbose:
-                    logger.info("")
+                    log_info("")
                     self._print_board()
-                    logger.info(f"Winner: P{pid} ({bot.name})")
+                    log_info("Winner: P%d (%s)", pid, bot.name)
                 break
 
-            if self._board_full():
+            if status == MoveStatus.DRAW:
                 if verbose:
-                    logger.info("")
+                    log_info("")
                     self._print_board()
-                    logger.info("Board full: draw among remaining players.")
+                    log_info("Board full: draw among remaining players.")
                 self.winner = None
                 break
 
-            self.current_player = self._next_active_player(pid)
+            self.current_player = next_active(pid)
             if verbose:
-                logger.info("")
+                log_info("")
 
         if verbose:
             logger.info("=== Game over ===")
 
-        eliminated_indices = [i for i, e in enumerate(self.eliminated) if e]
-
         return GameResult(
             winner_index=self.winner,
             board_name=self.config.name,
             player_names=[bot.name for bot in self.bots],
-            eliminated=eliminated_indices,
+            eliminated=self._eliminated_indices(),
         )
 
     def _print_board(self) -> None:
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info("   " + " ".join(str(x // 10) for x in range(self.W)))
         logger.info("   " + " ".join(str(x % 10) for x in range(self.W)))
-        for y in range(self.H):
-            row = []
-            for x in range(self.W):
-                c = self.board[x][y]
-                if c == BoardCell.EMPTY:
-                    row.append(".")
-                elif c == BoardCell.BLOCKED:
-                    row.append("#")
-                else:
-                    row.append(str(c))
-            logger.info(f"{y:02} " + " ".join(row))
+        rows = self._cell_chars[self.board - BoardCell.BLOCKED].tolist()
+        for y, row in enumerate(rows):
+            logger.info("%02d %s", y, " ".join(row))
         logger.info("")
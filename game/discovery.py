@@ -40,25 +40,26 @@ def board_module_to_config(mod) -> BoardConfig:
         height=mod.BOARD_HEIGHT,
         win_length=mod.WIN_LENGTH,
         num_players=mod.NUM_PLAYERS,
-        obstacles=list(mod.OBSTACLES),
+        obstacles=mod.OBSTACLES,
         time_ms=mod.GAME_TIME_MS,
     )
 
 
 def discover_bot_classes(bots_pkg: types.ModuleType) -> List[Type]:
     base = importlib.import_module(f"{bots_pkg.__name__}.base_bot").BaseBot
-    result: List[Type] = []
+    prefix = f"{bots_pkg.__name__}."
 
     for info in pkgutil.iter_modules(bots_pkg.__path__):
         if info.name == "base_bot":
             continue
 
-        mod = importlib.import_module(f"{bots_pkg.__name__}.{info.name}")
+        importlib.import_module(f"{prefix}{info.name}")
 
-        # Find all classes in this module that inherit from BaseBot
-        for attr_name in dir(mod):
-            attr = getattr(mod, attr_name)
-            if isinstance(attr, type) and issubclass(attr, base) and attr is not base:
-                result.append(attr)
+    # Importing registered every bot with BaseBot; walk the subclass tree
+    # (the list grows while iterating, picking up subclasses of subclasses)
+    classes = base.__subclasses__()
+    for cls in classes:
+        classes.extend(cls.__subclasses__())
 
-    return result
+    # dict.fromkeys: drop diamond duplicates, keep definition order
+    return [cls for cls in dict.fromkeys(classes) if cls.__module__.startswith(prefix)]
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import itertools
 import logging
+import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from .arbiter import Arbiter
+import numpy as np
+
+from .arbiter import Arbiter, BoardConfig, GameResult, make_board_template
 from .discovery import (
     load_package,
     discover_board_modules,
@@ -22,7 +27,112 @@ def _safe(s: str) -> str:
     return "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in s)
 
 
-def run_tournament(boards_dir: str, bots_dir: str, logs_dir: str, verbose_level: str,) -> Dict[str, int]:
+class _GameLogHandler(logging.FileHandler):
+    """
+    One FileHandler for the whole tournament, pointed at the current game's
+    log file with setStream(). start_game() opens a game's file, end_game()
+    closes it and parks the handler on os.devnull; the runner attaches it to
+    the logger only in between.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(os.devnull, mode="w", encoding="utf-8")
+        self._idle_stream = self.stream
+
+    def _switch(self, new_stream) -> None:
+        old_stream = self.setStream(new_stream)
+        if old_stream is not None and old_stream is not self._idle_stream:
+            old_stream.close()
+
+    def start_game(self, path: Path) -> None:
+        self._switch(open(path, "w", encoding="utf-8", buffering=1 << 16))
+
+    def end_game(self) -> None:
+        self._switch(self._idle_stream)
+
+    def flush(self) -> None:
+        # StreamHandler.emit() flushes after every record, which would defeat
+        # the file buffer; game files are flushed when end_game() closes them
+        pass
+
+    def close(self) -> None:
+        self.end_game()
+        super().close()
+
+
+class _GameLineBuffer(logging.Handler):
+    """Collects one game's formatted lines in a worker process for the parent to log."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lines: List[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.lines.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def take(self) -> str:
+        text, self.lines = "\n".join(self.lines), []
+        return text
+
+
+# Set in worker processes only; None when games run in the parent
+_game_lines: Optional[_GameLineBuffer] = None
+
+
+def _init_worker(boards_dir: str, bots_dir: str) -> None:
+    global _game_lines
+
+    # Bot classes are pickled by module name, so the worker needs the same
+    # dynamic packages the parent loaded
+    load_package(boards_dir, "dynamic_boards")
+    load_package(bots_dir, "dynamic_bots")
+
+    # Drop handlers inherited on fork: all output goes back to the parent
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    _game_lines = _GameLineBuffer()
+    _game_lines.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_game_lines)
+
+
+def _play_one(
+    cfg: BoardConfig,
+    bot_classes: Sequence[type],
+    board_template: np.ndarray,
+    verbose: bool,
+    perm_idx: Tuple[int, ...],
+) -> Tuple[GameResult, str]:
+    arb = Arbiter(cfg, [bot_classes[i] for i in perm_idx], board_template=board_template)
+    # Verbose moves only for info-or-lower log level
+    result = arb.run(verbose=verbose)
+
+    # In the parent the game already logged through the normal handlers
+    return result, _game_lines.take() if _game_lines is not None else ""
+
+
+def _default_workers() -> int:
+    # Bot time budgets are wall-clock (perf_counter), so games must not share
+    # a CPU: count the CPUs this process may run on, not the machine's, and
+    # keep one for the parent, which formats and writes every game's log
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS / Windows
+        cpus = os.cpu_count() or 1
+    return max(1, cpus - 1)
+
+
+def run_tournament(
+    boards_dir: str,
+    bots_dir: str,
+    logs_dir: str,
+    verbose_level: str,
+    workers: Optional[int] = None,
+) -> Dict[str, int]:
     logger.setLevel(logging.INFO)
     game_verbose = verbose_level.lower() in ("debug", "info")
 
@@ -33,7 +143,7 @@ def run_tournament(boards_dir: str, bots_dir: str, logs_dir: str, verbose_level:
             if p.is_file():
                 p.unlink()
         except Exception as e:
-            logger.error(f"Could not delete '{p}': {e}")
+            logger.error("Could not delete '%s': %s", p, e)
 
     boards_pkg = load_package(boards_dir, "dynamic_boards")
     bots_pkg = load_package(bots_dir, "dynamic_bots")
@@ -50,81 +160,115 @@ def run_tournament(boards_dir: str, bots_dir: str, logs_dir: str, verbose_level:
 
     logger.info("Discovered boards:")
     for bm in board_modules:
-        logger.info(f"  - {bm.BOARD_NAME}")
+        logger.info("  - %s", bm.BOARD_NAME)
     logger.info("\nDiscovered bots:")
     for bc in bot_classes:
-        logger.info(f"  - {bc.__name__}")
+        logger.info("  - %s", bc.__name__)
     logger.info("")
 
+    bot_names = [bc.__name__ for bc in bot_classes]
+    safe_bot_names = [_safe(name) for name in bot_names]
+
     points = defaultdict(int)      # bot_name -> total points
     bot_games = defaultdict(int)   # bot_name -> games played
     draws = 0
     game_id = 0
 
-    for mod in board_modules:
-        cfg = board_module_to_config(mod)
-        num = cfg.num_players
-        logger.info(f"\n=== Board: {cfg.name} ({num} players) ===")
-
-        if len(bot_classes) < num:
-            msg = (
-                f"ERROR: Board '{cfg.name}' requires {num} players, "
-                f"but only {len(bot_classes)} bots are available."
-            )
-            logger.error(msg)
-            error_log = log_dir / f"ERROR__{_safe(cfg.name)}.log"
-            with error_log.open("w", encoding="utf-8") as f:
-                f.write(msg + "\n")
-            raise RuntimeError(msg)
-
-        for perm in itertools.permutations(bot_classes, num):
-            game_id += 1
-            logger.info(f"\n--- Game {game_id} ---")
-
-            for i, bot_cls in enumerate(perm):
-                bot_name = bot_cls.__name__
-                logger.info(f"  P{i}: {bot_name}")
-                bot_games[bot_name] += 1
+    # One handler for the whole tournament, switched to each game's log file
+    # and attached to the logger only while that game is being logged
+    game_file_handler = _GameLogHandler()
+    game_file_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # Games are independent: play them in worker processes, log and score here
+    workers = workers or _default_workers()
+    pool: Optional[ProcessPoolExecutor] = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(boards_dir, bots_dir),
+        )
+
+    try:
+        for mod in board_modules:
+            cfg = board_module_to_config(mod)
+            num = cfg.num_players
+            logger.info("\n=== Board: %s (%d players) ===", cfg.name, num)
+
+            if len(bot_classes) < num:
+                msg = (
+                    f"ERROR: Board '{cfg.name}' requires {num} players, "
+                    f"but only {len(bot_classes)} bots are available."
+                )
+                logger.error(msg)
+                error_log = log_dir / f"ERROR__{_safe(cfg.name)}.log"
+                with error_log.open("w", encoding="utf-8") as f:
+                    f.write(msg + "\n")
+                raise RuntimeError(msg)
 
             board_part = _safe(cfg.name)
-            bots_part = "__".join(_safe(cls.__name__) for cls in perm)
-            game_log = log_dir / f"game_{game_id:03d}__{board_part}__{bots_part}.log"
-
-            file_handler = logging.FileHandler(game_log, mode="w", encoding="utf-8")
-            file_handler.setFormatter(logging.Formatter("%(message)s"))
-            logger.addHandler(file_handler)
-            logger.info(f"[LOG] Writing this game to: {game_log}")
-
-            arb = Arbiter(cfg, list(perm))
-            # Verbose moves only for info-or-lower log level
-            result = arb.run(verbose=game_verbose)
-
-            if result.winner_index is None:
-                logger.info("Result: draw.")
-                draws += 1
-
-                eliminated_set = set(result.eliminated)
-                for idx, bot_cls in enumerate(perm):
-                    if idx in eliminated_set:
-                        continue
-                    points[bot_cls.__name__] += 1
+            # Every permutation starts from the same board: build it once, copy per game
+            board_template = make_board_template(cfg)
+
+            perms = list(itertools.permutations(range(len(bot_classes)), num))
+            play = partial(_play_one, cfg, bot_classes, board_template, game_verbose)
+            if pool is not None:
+                chunksize = max(1, len(perms) // (4 * workers))
+                results = pool.map(play, perms, chunksize=chunksize)
             else:
-                winner_cls = perm[result.winner_index]
-                winner_name = winner_cls.__name__
-                logger.info(f"\nResult: {winner_name} wins.")
-                points[winner_name] += 2
+                # Lazy: each game runs when its result is taken, after its header
+                results = map(play, perms)
+
+            for perm_idx in perms:
+                game_id += 1
+                logger.info("\n--- Game %d ---", game_id)
+
+                for i, bot_idx in enumerate(perm_idx):
+                    bot_name = bot_names[bot_idx]
+                    logger.info("  P%d: %s", i, bot_name)
+                    bot_games[bot_name] += 1
+
+                bots_part = "__".join(safe_bot_names[i] for i in perm_idx)
+                game_log = log_dir / f"game_{game_id:03d}__{board_part}__{bots_part}.log"
+
+                game_file_handler.start_game(game_log)
+                logger.addHandler(game_file_handler)
+                logger.info("[LOG] Writing this game to: %s", game_log)
+
+                result, game_text = next(results)
+                if game_text:
+                    logger.info("%s", game_text)
+
+                if result.winner_index is None:
+                    logger.info("Result: draw.")
+                    draws += 1
+
+                    eliminated_set = set(result.eliminated)
+                    for idx, bot_idx in enumerate(perm_idx):
+                        if idx in eliminated_set:
+                            continue
+                        points[bot_names[bot_idx]] += 1
+                else:
+                    winner_name = bot_names[perm_idx[result.winner_index]]
+                    logger.info("\nResult: %s wins.", winner_name)
+                    points[winner_name] += 2
 
-            logger.removeHandler(file_handler)
-            file_handler.close()
+                logger.removeHandler(game_file_handler)
+                game_file_handler.end_game()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        logger.removeHandler(game_file_handler)
+        game_file_handler.close()
 
     logger.info("\n=== Tournament summary ===")
 
     total_games = game_id
     total_points = sum(points.values())
 
-    logger.info(f"Total games played: {total_games}")
-    logger.info(f"Total points awarded: {total_points}")
-    logger.info(f"Draw games: {draws}")
+    logger.info("Total games played: %d", total_games)
+    logger.info("Total points awarded: %d", total_points)
+    logger.info("Draw games: %d", draws)
 
     if bot_games:
         logger.info("\nPer-bot statistics:")
@@ -135,6 +279,6 @@ def run_tournament(boards_dir: str, bots_dir: str, logs_dir: str, verbose_level:
         for name in ordered_names:
             g = bot_games[name]
             p = points.get(name, 0)
-            logger.info(f"  {name}: {p} points in {g} games")
+            logger.info("  %s: %d points in %d games", name, p, g)
 
     return dict(points)
@@ -29,6 +29,11 @@ def main() -> None:
                         choices=["debug", "info", "warning", "error"],
                         help="Logging level (default: info)")
 
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for playing games (default: usable CPUs - 1). "
+                             "Bot time limits are wall-clock, so more workers than "
+                             "CPUs eat into each bot's budget")
+
     args = parser.parse_args()
 
     run_tournament(
@@ -36,6 +41,7 @@ def main() -> None:
         bots_dir=args.bots,
         logs_dir=args.logs,
         verbose_level=args.verbose,
+        workers=args.workers,
     )
 
 